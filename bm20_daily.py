@@ -5,13 +5,15 @@
 # - 코인별 퍼포먼스(상승=초록/하락=빨강), BTC/ETH 7일 추세 차트
 # - 에디토리얼 톤 뉴스(제목+본문, BTC/ETH 현재가 포함)
 # - 기간수익률(1D/7D/30D/MTD/YTD) 계산, 인덱스 히스토리 저장
+# - 리스크 지표(30D 롤링 변동성·샤프, 최대낙폭·낙폭 지속일) + 구성종목 기간별 기여도 (증분 갱신)
 # - HTML + PDF 저장
-# 의존: pandas, requests, matplotlib, reportlab, jinja2
+# 의존: pandas, numpy, requests, matplotlib, reportlab, jinja2
 
-import os, time, json, random, subprocess
+import os, io, time, json, random, subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import requests
+import numpy as np
 import pandas as pd
 
 # ---- Matplotlib ----
@@ -49,6 +51,7 @@ trend_png = OUT_DIR_DATE / f"bm20_trend_{YMD}.png"
 pdf_path  = OUT_DIR_DATE / f"bm20_daily_{YMD}.pdf"
 html_path = OUT_DIR_DATE / f"bm20_daily_{YMD}.html"
 kp_path   = OUT_DIR_DATE / f"kimchi_{YMD}.json"
+attr_path = OUT_DIR_DATE / f"bm20_attribution_{YMD}.csv"
 
 # ================== Fonts (Nanum 우선, 실패 시 CID) ==================
 NANUM_PATH = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
@@ -325,18 +328,20 @@ else:
 hist = hist.sort_values("date").reset_index(drop=True)
 hist.to_csv(HIST_CSV, index=False, encoding="utf-8")
 
+# 기간 수익률: 정렬된 날짜 배열 이진탐색 — 기간마다 hist 를 다시 훑지 않음
+HIST_DATES  = hist["date"].to_numpy(dtype=str)
+HIST_LEVELS = hist["index"].to_numpy(dtype=float)
+
+def level_on_or_before(yyyymmdd: str):
+    i = int(np.searchsorted(HIST_DATES, yyyymmdd, side="right")) - 1
+    return None if i < 0 else float(HIST_LEVELS[i])
+
 def period_return(days: int):
     if len(hist) < 2: return None
-    try:
-        ref_date = (datetime.strptime(YMD, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
-        ref_series = hist[hist["date"] <= ref_date]
-        if ref_series.empty: return None
-        ref_idx = float(ref_series.iloc[-1]["index"])
-        cur_idx = float(hist.iloc[-1]["index"])
-        if ref_idx == 0: return None
-        return (cur_idx / ref_idx - 1.0) * 100.0
-    except Exception:
-        return None
+    ref_date = (datetime.strptime(YMD, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+    ref_idx = level_on_or_before(ref_date)
+    if not ref_idx: return None
+    return (float(HIST_LEVELS[-1]) / ref_idx - 1.0) * 100.0
 
 def pct_fmt(v, digits=2): return "-" if v is None else f"{v:+.{digits}f}%"
 
@@ -348,16 +353,291 @@ today_dt = datetime.strptime(YMD, "%Y-%m-%d")
 month_start = today_dt.replace(day=1).strftime("%Y-%m-%d")
 year_start  = today_dt.replace(month=1, day=1).strftime("%Y-%m-%d")
 
-def level_on_or_before(yyyymmdd: str):
-    s = hist[hist["date"] <= yyyymmdd]
-    return None if s.empty else float(s.iloc[-1]["index"])
-
 lvl_month = level_on_or_before(month_start)
 lvl_year  = level_on_or_before(year_start)
-lvl_now   = float(hist.iloc[-1]["index"])
+lvl_now   = float(HIST_LEVELS[-1])
 RET_MTD = None if not lvl_month or lvl_month==0 else (lvl_now/lvl_month - 1)*100
 RET_YTD = None if not lvl_year  or lvl_year==0  else (lvl_now/lvl_year  - 1)*100
 
+# 7-1) 리스크 지표 — 롤링 변동성/샤프(무위험 0), 낙폭·낙폭 지속일
+RISK_DAYS    = 30               # 롤링 창(달력일) — RET_30D 와 같은 기준
+RISK_MIN_OBS = 20               # 창 안의 일간(1일 간격) 수익률이 이보다 적으면 산출하지 않음
+ANN_FACTOR   = np.sqrt(365.0)   # 24/7 시장 → 365일 연율화
+ANA_CSV      = HIST_DIR / "bm20_index_analytics.csv"
+ANA_COLS     = ["date","index","gap_days","ret","vol","sharpe","peak","peak_date","drawdown","mdd","dd_days","max_dd_days"]
+
+def load_cache(path, cols, required, dtype=None):
+    # 파생 캐시 로드: 읽기 실패·구버전/부분 스키마·필수값 결측이면 None → 호출부에서 전체 재계산
+    try:
+        if not path.exists(): return None
+        x = pd.read_csv(path, dtype=dtype)
+    except Exception:
+        return None
+    if list(x.columns) != cols or x[required].isna().any().any():
+        return None
+    return x
+
+def csv_rows(path):
+    # CSV 원본에서 데이터 행 시작 오프셋과 첫 열(YYYY-MM-DD)만 훑음 — 파싱 없이 검증·잘라내기용
+    # 반환: (바이트, 완결된 데이터 행 시작 오프셋, 행 날짜(bytes S10), 마지막 완결 행 끝 오프셋)
+    buf = np.frombuffer(path.read_bytes(), dtype=np.uint8)
+    nl  = np.flatnonzero(buf == 10)
+    if not len(nl):
+        return buf, nl, np.array([], dtype="S10"), 0
+    starts = nl[:-1] + 1
+    idx    = np.minimum(starts[:, None] + np.arange(10), len(buf) - 1)
+    dates  = buf[idx].view("S10").ravel()
+    return buf, starts, dates, int(nl[-1]) + 1
+
+def write_tail(path, rows, keep, rec=None):
+    # 앞쪽 keep 개 데이터 행은 그대로 두고 나머지를 잘라낸 뒤 rows 를 덧붙임 — 바뀐 꼬리만 기록
+    _, starts, _, end = rec if rec is not None else csv_rows(path)
+    with open(path, "r+b") as f:
+        f.truncate(int(starts[keep]) if keep < len(starts) else end)
+    rows.to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
+
+def cached_prefix(h, prev):
+    # prev(이전 실행 결과)와 날짜·레벨이 같은 앞부분 길이 — 이후 구간만 다시 계산하면 됨
+    # (hist 는 소수 6자리 반올림 값 → 상대 허용오차 없이 비교해야 같은 날 재실행의 미세 변동도 반영)
+    if prev is None or not len(prev): return 0
+    n  = min(len(prev), len(h))
+    eq = (prev["date"].to_numpy(dtype=str)[:n] == h["date"].to_numpy(dtype=str)[:n]) & \
+         np.isclose(prev["index"].to_numpy(dtype=float)[:n], h["index"].to_numpy(dtype=float)[:n], rtol=0.0, atol=1e-9)
+    return n if eq.all() else int(np.argmin(eq))
+
+def index_analytics(h, prev=None):
+    # cached_prefix 까지는 prev 재사용,
+    # 이후 구간만 (롤링 창 RISK_DAYS 만큼의 과거 + 누적 고점/낙폭 상태 이월)으로 계산
+    dates = h["date"].to_numpy(dtype=str)
+    lv    = h["index"].to_numpy(dtype=float)
+    start = cached_prefix(h, prev)
+    if start == len(h):
+        return prev.iloc[:start].reset_index(drop=True)
+
+    # 창 (t-30D, t] 에 드는 첫 관측의 직전 관측부터 → 창 안 모든 수익률을 다시 구할 수 있음
+    cutoff = (pd.Timestamp(str(dates[start])) - pd.Timedelta(days=RISK_DAYS)).strftime("%Y-%m-%d")
+    lo  = max(int(np.searchsorted(dates, cutoff, side="right")) - 1, 0)
+    dt  = pd.to_datetime(dates[lo:])
+    gap = pd.Series(dt).diff().dt.days.to_numpy()
+    ret = pd.Series(lv[lo:], index=dt).pct_change()
+    # 관측 공백(간격 > 1일) 구간의 수익률은 여러 날의 변동이 한 번에 잡히므로 변동성·샤프에서 제외
+    roll = ret.where(gap == 1).rolling(f"{RISK_DAYS}D", min_periods=RISK_MIN_OBS)
+    mu, sd = roll.mean(), roll.std()
+    vol    = sd * ANN_FACTOR * 100.0
+    sharpe = mu / sd.replace(0.0, np.nan) * ANN_FACTOR
+    k = start - lo
+
+    new_lv, new_dates = lv[start:], dates[start:]
+    if start:
+        last = prev.iloc[start - 1]
+        peak0, peak_date0 = float(last["peak"]), str(last["peak_date"])
+        mdd0, max_dd_days0 = float(last["mdd"]), int(last["max_dd_days"])
+    else:
+        peak0, peak_date0, mdd0, max_dd_days0 = -np.inf, new_dates[0], 0.0, 0
+
+    peak      = np.maximum.accumulate(np.maximum(new_lv, peak0))
+    peak_date = pd.Series(np.where(new_lv >= peak, new_dates, None)).ffill().fillna(peak_date0).to_numpy(dtype=str)
+    drawdown  = (new_lv / peak - 1.0) * 100.0
+    dd_days   = (pd.to_datetime(new_dates) - pd.to_datetime(peak_date)).days.to_numpy()
+
+    out = pd.DataFrame({
+        "date": new_dates, "index": new_lv, "gap_days": gap[k:],
+        "ret": ret.to_numpy()[k:] * 100.0, "vol": vol.to_numpy()[k:], "sharpe": sharpe.to_numpy()[k:],
+        "peak": peak, "peak_date": peak_date, "drawdown": drawdown,
+        "mdd": np.minimum.accumulate(np.minimum(drawdown, mdd0)),
+        "dd_days": dd_days,
+        "max_dd_days": np.maximum.accumulate(np.maximum(dd_days, max_dd_days0)),
+    })
+    if start:
+        out = pd.concat([prev.iloc[:start], out], ignore_index=True)
+    return out
+
+ana_prev = load_cache(ANA_CSV, ANA_COLS, ["date","index","peak","peak_date","drawdown","mdd","dd_days","max_dd_days"],
+                      dtype={"date":str, "peak_date":str})
+ANA_START = cached_prefix(hist, ana_prev)
+ana = index_analytics(hist, ana_prev)
+if ana_prev is None:
+    ana.to_csv(ANA_CSV, index=False, encoding="utf-8")
+else:
+    write_tail(ANA_CSV, ana.iloc[ANA_START:], ANA_START)
+
+def num_or_none(v): return None if pd.isna(v) else float(v)
+
+risk_now    = ana.iloc[-1]
+VOL_30D     = num_or_none(risk_now["vol"])
+SHARPE_30D  = num_or_none(risk_now["sharpe"])
+DD_NOW      = float(risk_now["drawdown"])
+MDD         = float(risk_now["mdd"])
+DD_DAYS     = int(risk_now["dd_days"])
+MAX_DD_DAYS = int(risk_now["max_dd_days"])
+
+# 7-2) 구성종목 기여도 — 일간 기여를 지수 포인트로 연결, 날짜별 기간 귀속을 증분 저장
+#   contrib_raw : 당일 가중 바스켓 24h 변동 중 종목 몫(%p), 보정 없이 그대로 사용
+#   _RESID 행   : 직전 관측일 대비 지수 변동률 - Σ contrib_raw (매일 가중치 재산정·관측 공백에서 생기는 차이)
+#   contrib_pt  : contrib_pct × L[t-1] / 100 (지수 포인트), cum_pt 는 종목별 누적합 → 날짜별 Σ = L[t] - L[t-1]
+#   attr_<기간> : (cum_pt[t] - cum_pt[기준일]) / L[기준일] × 100
+#   _OUT 행     : 그날 구성종목이 아닌(편출) 종목들의 귀속 합 → 구성종목 + _OUT + _RESID = RET_<기간>
+CONTRIB_CSV   = HIST_DIR / "bm20_contrib_history.csv"   # 날짜·종목별 기여/귀속 기록(뒤쪽만 잘라내고 덧붙임)
+CONTRIB_STATE = HIST_DIR / "bm20_contrib_cum.csv"       # 날짜별 level + 종목별 cum_pt — 증분 계산 상태
+ATTR_PERIODS = ["1D","7D","30D","MTD","YTD"]
+ATTR_COLS    = [f"attr_{k}" for k in ATTR_PERIODS]
+CONTRIB_COLS = ["date","symbol","contrib_raw","contrib_pct","contrib_pt","cum_pt", *ATTR_COLS]
+RESID_SYM, OUT_SYM = "_RESID", "_OUT"
+ATTR_LABELS = {OUT_SYM: "편출 종목", RESID_SYM: "리밸런싱·잔차"}
+df["contrib_raw"] = df["contribution"] / prev_value * 100.0 if prev_value else 0.0
+
+def backfill_contrib(dates):
+    # 날짜별 산출 CSV 의 contribution 으로 contrib_raw 복원 (캐시에 없는 날짜만)
+    rows = []
+    for d in dates:
+        p = OUT_DIR / d / f"bm20_daily_data_{d}.csv"
+        try:
+            x = pd.read_csv(p)
+            pv = float((x["previous_price"] * x["weight_ratio"]).sum())
+            if not pv: continue
+            rows.append(pd.DataFrame({"date": d, "symbol": x["symbol"], "contrib_raw": x["contribution"] / pv * 100.0}))
+        except Exception:
+            continue
+    return pd.concat(rows, ignore_index=True) if rows else pd.DataFrame({"date": [], "symbol": [], "contrib_raw": []})
+
+def attr_ref_dates(dts):
+    # 기간별 기준 달력일 — period_return/RET_MTD/RET_YTD 와 같은 규칙(이후 hist 에서 on-or-before 조회)
+    dt = pd.to_datetime(dts)
+    return {
+        "1D":  (dt - pd.Timedelta(days=1)).strftime("%Y-%m-%d").to_numpy(dtype=str),
+        "7D":  (dt - pd.Timedelta(days=7)).strftime("%Y-%m-%d").to_numpy(dtype=str),
+        "30D": (dt - pd.Timedelta(days=30)).strftime("%Y-%m-%d").to_numpy(dtype=str),
+        "MTD": np.char.add(dts.astype("<U8"), "01"),
+        "YTD": np.char.add(dts.astype("<U5"), "01-01"),
+    }
+
+def contrib_attribution(raw, state, new_dates):
+    # raw      : new_dates 의 (date, symbol, contrib_raw) — 날짜에 행이 없으면 지수 변동 전부가 _RESID
+    # state    : new_dates 이전 모든 관측일의 누적표(index=date, level + 종목별 cum_pt)
+    # new_dates: 다시 계산할 hist 관측일(보통 오늘 하루) → 작업량은 새 날짜 수 × 종목 수
+    # 반환     : (new_dates 의 CONTRIB_COLS 행, new_dates 의 누적표 행)
+    pos = np.searchsorted(HIST_DATES, new_dates)
+    lv_prev = HIST_LEVELS[np.maximum(pos - 1, 0)]
+    move = np.where(pos > 0, (HIST_LEVELS[pos] / lv_prev - 1.0) * 100.0, 0.0)
+
+    raw = raw[raw["date"].isin(new_dates) & ~raw["symbol"].isin(ATTR_LABELS)]
+    raw = raw.drop_duplicates(["date","symbol"], keep="last")
+    rw  = raw.pivot(index="date", columns="symbol", values="contrib_raw").reindex(new_dates).astype(float)
+    cols = pd.Index(sorted(set(rw.columns) | set(state.columns.drop("level")) | {RESID_SYM}))
+    ri   = cols.get_loc(RESID_SYM)
+
+    R = rw.reindex(columns=cols).to_numpy()                           # NaN = 그날 구성종목 아님
+    R[:, ri] = 0.0
+    C = np.where(pos[:, None] > 0, R, np.where(np.isnan(R), np.nan, 0.0))   # 첫 관측일은 기준점 → 0
+    C[:, ri] = 0.0
+    C[:, ri] = move - np.nansum(C, axis=1)
+    PT = np.nan_to_num(C) * lv_prev[:, None] / 100.0
+
+    st = state.reindex(columns=cols).fillna(0.0).to_numpy(dtype=float)
+    NC = (st[-1] if len(st) else 0.0) + np.cumsum(PT, axis=0)
+    tab_dates = np.concatenate([state.index.to_numpy(dtype=str), new_dates])
+    tab = np.vstack([st, NC])
+
+    present = ~np.isnan(C)
+    absent  = ~present
+    ii, cc  = np.nonzero(present)
+    rows = {"date": new_dates[ii], "symbol": cols.to_numpy()[cc], "contrib_raw": R[ii, cc], "contrib_pct": C[ii, cc],
+            "contrib_pt": PT[ii, cc], "cum_pt": NC[ii, cc]}
+    out  = {"date": new_dates, "symbol": OUT_SYM, "contrib_raw": 0.0, "contrib_pct": 0.0, "contrib_pt": 0.0,
+            "cum_pt": np.where(absent, NC, 0.0).sum(axis=1)}
+    for k, ref in attr_ref_dates(new_dates).items():
+        j = np.searchsorted(HIST_DATES, ref, side="right") - 1
+        p = np.maximum(np.searchsorted(tab_dates, HIST_DATES[np.maximum(j, 0)], side="right") - 1, 0)
+        A = (NC - tab[p]) / HIST_LEVELS[np.maximum(j, 0)][:, None] * 100.0
+        A[j < 0] = np.nan                                             # 기준일이 히스토리 이전이면 산출 불가
+        rows[f"attr_{k}"] = A[ii, cc]
+        out[f"attr_{k}"]  = np.where(j < 0, np.nan, np.where(absent, A, 0.0).sum(axis=1))
+
+    rows = pd.concat([pd.DataFrame(rows), pd.DataFrame(out)], ignore_index=True)
+    rows = rows.sort_values(["date","symbol"], kind="stable").reset_index(drop=True)[CONTRIB_COLS]
+    st_rows = pd.DataFrame(NC, columns=cols)
+    st_rows.insert(0, "level", HIST_LEVELS[pos])
+    st_rows.insert(0, "date", new_dates)
+    return rows, st_rows
+
+def rec_dates(d):
+    # 날짜순 기록의 고유 날짜(정렬 유지) — 값이 바뀌는 지점만 취함
+    return d[np.r_[True, d[1:] != d[:-1]]] if len(d) else d
+
+def load_contrib_state():
+    # 누적표 + 기록 파일의 날짜 목록(csv_rows) — 둘이 어긋나거나 깨졌으면 None → 전체 재계산
+    try:
+        if not (CONTRIB_STATE.exists() and CONTRIB_CSV.exists()): return None, None
+        st = pd.read_csv(CONTRIB_STATE, dtype={"date":str})
+        rec = csv_rows(CONTRIB_CSV)
+    except Exception:
+        return None, None
+    header = bytes(rec[0][:rec[1][0]] if len(rec[1]) else rec[0]).decode("utf-8", "ignore").strip()
+    if (list(st.columns[:2]) != ["date","level"] or RESID_SYM not in st.columns or st.isna().any().any()
+            or not st["date"].is_monotonic_increasing or header != ",".join(CONTRIB_COLS)
+            or not np.array_equal(rec_dates(rec[2]), st["date"].to_numpy(dtype="S10"))):
+        return None, None
+    return st.set_index("date"), rec
+
+# 재계산 범위: 누적표의 날짜·레벨이 hist 와 처음 어긋나는 관측일(누락·변경 포함)부터, 오늘은 항상 다시 계산
+contrib_state, contrib_rec = load_contrib_state()
+if contrib_state is None:
+    contrib_state = pd.DataFrame({"level": []}, index=pd.Index([], name="date"), dtype=float)
+k0 = cached_prefix(hist, pd.DataFrame({"date": contrib_state.index, "index": contrib_state["level"]}))
+k0 = min(k0, len(HIST_DATES) - 1)
+redo_dates = HIST_DATES[k0:]
+state_keep = contrib_state.iloc[:k0]
+
+contrib_src = pd.DataFrame({"date": YMD, "symbol": df["symbol"], "contrib_raw": df["contrib_raw"]})
+if contrib_rec is not None and k0 < len(HIST_DATES) - 1:
+    # 다시 계산할 과거 관측일의 contrib_raw: 기록 파일 꼬리에서, 없으면 산출 CSV 에서
+    buf, starts, rec_d, end = contrib_rec
+    i0 = int(np.searchsorted(rec_d, redo_dates[0].encode()))
+    if i0 < len(starts):
+        tail = bytes(buf[:starts[0]]) + bytes(buf[starts[i0]:end])
+        old = pd.read_csv(io.BytesIO(tail), dtype={"date":str})[["date","symbol","contrib_raw"]]
+        contrib_src = pd.concat([old[old["date"] != YMD], contrib_src], ignore_index=True)
+have = set(contrib_src["date"])
+missing = [d for d in redo_dates[:-1] if d not in have]
+if missing:
+    contrib_src = pd.concat([backfill_contrib(missing), contrib_src], ignore_index=True)
+
+contrib_rows, state_rows = contrib_attribution(contrib_src, state_keep, redo_dates)
+state_cols = ["date", "level", *state_rows.columns[2:]]
+if contrib_rec is None:
+    contrib_rows.to_csv(CONTRIB_CSV, index=False, encoding="utf-8")
+else:
+    write_tail(CONTRIB_CSV, contrib_rows, int(np.searchsorted(contrib_rec[2], redo_dates[0].encode())), contrib_rec)
+if contrib_rec is None or state_cols != ["date", *contrib_state.columns]:
+    # 새 종목 편입 등으로 열 구성이 바뀌면 누적표만 전체 재기록(날짜 수 × 종목 수, 작음)
+    pd.concat([state_keep.reindex(columns=state_cols[1:]).fillna(0.0).rename_axis("date").reset_index(), state_rows],
+              ignore_index=True).to_csv(CONTRIB_STATE, index=False, encoding="utf-8")
+else:
+    write_tail(CONTRIB_STATE, state_rows, k0)
+
+attr_all   = contrib_rows[contrib_rows["date"] == YMD].set_index("symbol")[ATTR_COLS].astype(float)
+attr_all.columns = ATTR_PERIODS
+attr_extra = attr_all.loc[[s for s in ATTR_LABELS if s in attr_all.index]]
+attr_today = attr_all.drop(index=attr_extra.index)
+attr_today = attr_today.reindex(attr_today["30D"].abs().sort_values(ascending=False, na_position="last").index)
+
+def pp_fmt(v, digits=2): return "-" if v is None or pd.isna(v) else f"{v:+.{digits}f}%p"
+
+def attr_line(col, n=3, ascending=False):
+    s = attr_today[col].dropna().sort_values(ascending=ascending).head(n)
+    return " · ".join(f"{sym} {pp_fmt(v)}" for sym, v in s.items()) or "-"
+
+ATTR_TOP = attr_line("30D")
+ATTR_BOT = attr_line("30D", ascending=True)
+
+# 귀속표: 구성종목 + 편출 종목 + 리밸런싱·잔차, 합계 = RET_<기간> (CSV 는 전체, 리포트 표는 상위 ATTR_SHOW + 기타)
+ATTR_SHOW = 5
+attr_report = pd.concat([attr_today, attr_extra.rename(index=ATTR_LABELS)])
+attr_report.loc["합계"] = attr_report.sum(min_count=1)
+attr_table = pd.concat([attr_today.head(ATTR_SHOW),
+                        attr_today.iloc[ATTR_SHOW:].sum(min_count=1).to_frame("기타 구성종목").T,
+                        attr_report.iloc[len(attr_today):]])
+
 # 8) 에디토리얼 톤 뉴스
 def build_news_editorial():
     def pct(v):  return f"{float(v):+,.2f}%"
@@ -401,6 +681,7 @@ news = f"{news_title}\n{news_body}"
 with open(txt_path,"w",encoding="utf-8") as f: f.write(news)
 df_out=df[["symbol","name","current_price","previous_price","price_change_pct","market_cap","total_volume","weight_ratio","contribution"]]
 df_out.to_csv(csv_path, index=False, encoding="utf-8")
+attr_report.rename_axis("symbol").reset_index().to_csv(attr_path, index=False, encoding="utf-8")
 write_json(kp_path, {"date":YMD, **(kp_meta or {}), "kimchi_pct": (None if kimchi_pct is None else round(float(kimchi_pct),4))})
 
 # ================== Charts ==================
@@ -475,11 +756,21 @@ story = []
 story += [Paragraph("BM20 데일리 리포트", title_style),
           Paragraph(f"{YMD}", subtitle_style)]
 
+VOL_TEXT    = "-" if VOL_30D is None else f"{VOL_30D:.2f}%"
+SHARPE_TEXT = "-" if SHARPE_30D is None else f"{SHARPE_30D:+.2f}"
+DD_TEXT     = f"{DD_NOW:.2f}% ({DD_DAYS}일) / {MDD:.2f}% (최장 {MAX_DD_DAYS}일)"
+attr_rows   = [{"sym": sym, **{k: pp_fmt(r[k]) for k in ATTR_PERIODS}} for sym, r in attr_table.iterrows()]
+
 metrics = [
     ["지수",        f"{bm20_now:,.2f} pt"],
     ["일간 변동",   f"{bm20_chg:+.2f}%"],
     ["상승/하락",   f"{num_up} / {num_down}"],
     ["수익률(1D/7D/30D/MTD/YTD)", f"{pct_fmt(RET_1D)} / {pct_fmt(RET_7D)} / {pct_fmt(RET_30D)} / {pct_fmt(RET_MTD)} / {pct_fmt(RET_YTD)}"],
+    ["변동성(30D, 연율)", VOL_TEXT],
+    ["샤프(30D, 연율)", SHARPE_TEXT],
+    ["낙폭(현재/최대)", DD_TEXT],
+    ["기여 상위(30D)", ATTR_TOP],
+    ["기여 하위(30D)", ATTR_BOT],
     ["김치 프리미엄", kp_text],
     ["펀딩비(Binance)", BIN_TEXT],
 ]
@@ -499,6 +790,11 @@ style_table_basic(t_up); style_table_basic(t_dn)
 story += [card([Paragraph("상승/하락 TOP3", section_h), Spacer(1,4), t_up, Spacer(1,6), t_dn]),
           Spacer(1, 0.45*cm)]
 
+tbl_attr = [["종목", *ATTR_PERIODS], *[[r["sym"], *[r[k] for k in ATTR_PERIODS]] for r in attr_rows]]
+t_attr = Table(tbl_attr, colWidths=[3.5*cm] + [2.5*cm]*len(ATTR_PERIODS)); style_table_basic(t_attr)
+story += [card([Paragraph(f"구성종목 기여도 (30D 상위 {ATTR_SHOW} + 기타, %p)", section_h), Spacer(1,4), t_attr]),
+          Spacer(1, 0.45*cm)]
+
 trend_block = [Paragraph("BTC & ETH 7일 가격 추세", section_h)]
 if trend_png.exists(): trend_block += [Image(str(trend_png), width=16.0*cm, height=5.2*cm)]
 story += [card(trend_block), Spacer(1, 0.45*cm)]
@@ -533,6 +829,11 @@ img{max-width:100%}
       <tr><th>일간 변동</th><td>{{ bm20_chg }}</td></tr>
       <tr><th>상승/하락</th><td>{{ num_up }} / {{ num_down }}</td></tr>
       <tr><th>수익률(1D/7D/30D/MTD/YTD)</th><td>{{ ret_1d }} / {{ ret_7d }} / {{ ret_30d }} / {{ ret_mtd }} / {{ ret_ytd }}</td></tr>
+      <tr><th>변동성(30D, 연율)</th><td>{{ vol_text }}</td></tr>
+      <tr><th>샤프(30D, 연율)</th><td>{{ sharpe_text }}</td></tr>
+      <tr><th>낙폭(현재/최대)</th><td>{{ dd_text }}</td></tr>
+      <tr><th>기여 상위(30D)</th><td>{{ attr_top }}</td></tr>
+      <tr><th>기여 하위(30D)</th><td>{{ attr_bot }}</td></tr>
       <tr><th>김치 프리미엄</th><td>{{ kp_text }}</td></tr>
       <tr><th>펀딩비(Binance)</th><td>{{ bin_text }}</td></tr>
       {% if byb_text %}<tr><th>펀딩비(Bybit)</th><td>{{ byb_text }}</td></tr>{% endif %}
@@ -549,6 +850,12 @@ img{max-width:100%}
       {% for r in top_dn %}<tr><td>{{ r.sym }}</td><td style="text-align:right">{{ r.pct }}</td></tr>{% endfor %}
     </table>
   </div>
+  <div class="card">
+    <h2>구성종목 기여도 (30D 상위 {{ attr_show }} + 기타, %p)</h2>
+    <table><tr><th>종목</th>{% for k in attr_periods %}<th style="text-align:right">{{ k }}</th>{% endfor %}</tr>
+      {% for r in attr_rows %}<tr><td>{{ r.sym }}</td>{% for k in attr_periods %}<td style="text-align:right">{{ r[k] }}</td>{% endfor %}</tr>{% endfor %}
+    </table>
+  </div>
   <div class="card">
     <h2>BTC & ETH 7일 가격 추세</h2>
     {% if trend_png %}<p class="center"><img src="{{ trend_png }}" alt="Trend"></p>{% endif %}
@@ -562,6 +869,8 @@ html = html_tpl.render(
     num_up=num_up, num_down=num_down,
     ret_1d=pct_fmt(RET_1D), ret_7d=pct_fmt(RET_7D), ret_30d=pct_fmt(RET_30D),
     ret_mtd=pct_fmt(RET_MTD), ret_ytd=pct_fmt(RET_YTD),
+    vol_text=VOL_TEXT, sharpe_text=SHARPE_TEXT, dd_text=DD_TEXT, attr_top=ATTR_TOP, attr_bot=ATTR_BOT,
+    attr_show=ATTR_SHOW, attr_periods=ATTR_PERIODS, attr_rows=attr_rows,
     kp_text=kp_text, bin_text=BIN_TEXT, byb_text=BYB_TEXT,
     top_up=[{"sym":r["symbol"], "pct": f"{r['price_change_pct']:+.2f}%"} for _,r in top_up.iterrows()],
     top_dn=[{"sym":r["symbol"], "pct": f"{r['price_change_pct']:+.2f}%"} for _,r in top_dn.iterrows()],
@@ -570,4 +879,4 @@ html = html_tpl.render(
 )
 with open(html_path, "w", encoding="utf-8") as f: f.write(html)
 
-print("Saved:", txt_path, csv_path, bar_png, trend_png, pdf_path, html_path, kp_path)
+print("Saved:", txt_path, csv_path, bar_png, trend_png, pdf_path, html_path, kp_path, attr_path)